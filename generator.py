@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 
 
-import qrcode
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk
+from tkinter import ttk
+from PIL import Image, ImageOps, ImageTk
 import os
-from datetime import datetime
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Maps segno matrix values (1 = dark module) to greyscale pixel values
+MODULE_PIXELS = bytes.maketrans(b"\x00\x01", b"\xff\x00")
 
 
 class QRCodeGenerator:
@@ -20,6 +25,30 @@ class QRCodeGenerator:
     - Save the QR code as an image file
     """
     
+    # Maximum number of generated QR codes kept for reuse
+    QR_CACHE_SIZE = 16
+    
+    # Maximum number of preview PhotoImages kept for reuse
+    PHOTO_CACHE_SIZE = 4
+    
+    # Maximum number of entries kept in the activity log
+    LOG_SIZE = 200
+    
+    # (box_size, border) for each size option
+    _SIZE_MAP = {
+        "Small": (8, 2),
+        "Medium": (10, 4),
+        "Large": (15, 6)
+    }
+    
+    # segno error correction level for each error correction option
+    _EC_MAP = {
+        "Low": "L",
+        "Medium": "M",
+        "High": "Q",
+        "Highest": "H"
+    }
+    
     def __init__(self, root):
         """
         Initialize the QR Code Generator GUI.
@@ -33,9 +62,28 @@ class QRCodeGenerator:
         self.root.configure(bg='#f0f0f0')
         
         # Variables to store QR code data
+        self.qr_code = None
+        self.qr_size_params = None
         self.qr_image = None
         self.current_data = ""
         
+        # Recently generated images keyed by (data, size, error correction)
+        self._qr_cache = OrderedDict()
+        
+        # Preview PhotoImages for the most recently displayed QR codes
+        self._photo_cache = OrderedDict()
+        
+        # Worker thread that encodes and renders QR codes off the Tk thread
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Future of the render whose result should be displayed, if any
+        self._pending_render = None
+        
+        # Activity log of (time.monotonic(), message) entries, kept in
+        # memory so user actions never write to the console
+        self._log = deque(maxlen=self.LOG_SIZE)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -228,27 +276,62 @@ class QRCodeGenerator:
         Returns:
             tuple: (box_size, border) parameters for QR code generation
         """
-        size_map = {
-            "Small": (8, 2),
-            "Medium": (10, 4),
-            "Large": (15, 6)
-        }
-        return size_map.get(self.size_var.get(), (10, 4))
+        return self._SIZE_MAP.get(self.size_var.get(), (10, 4))
     
     def get_error_correction(self):
         """
         Get error correction level based on user selection.
         
         Returns:
-            qrcode constant: Error correction level
+            str: segno error correction level
+        """
+        return self._EC_MAP.get(self.error_var.get(), "M")
+    
+    def _render_qr(self, data, box_size, border, error_correction):
+        """
+        Encode the data and render the QR code images.
+        
+        Runs on the worker thread, so it must not touch any tkinter state.
+        
+        Args:
+            data: The URL or text to encode
+            box_size: Pixels per module in the saved image
+            border: Quiet zone width in modules
+            error_correction: segno error correction level
+        
+        Returns:
+            tuple: (qr_code, qr_image, preview) where qr_code is the encoded
+            segno.QRCode, qr_image is rendered at the selected size for
+            saving and preview fits the display area
         """
-        error_map = {
-            "Low": qrcode.constants.ERROR_CORRECT_L,
-            "Medium": qrcode.constants.ERROR_CORRECT_M,
-            "High": qrcode.constants.ERROR_CORRECT_Q,
-            "Highest": qrcode.constants.ERROR_CORRECT_H
-        }
-        return error_map.get(self.error_var.get(), qrcode.constants.ERROR_CORRECT_M)
+        # segno is imported on first use, on the worker thread, so it does
+        # not delay the window appearing at startup
+        import segno
+        
+        # Encode the data in the smallest regular QR code version that
+        # fits, keeping the selected error correction level
+        qr = segno.make_qr(data, error=error_correction, boost_error=False)
+        
+        # Build a one-pixel-per-module bitmap from the matrix so the
+        # images below are scaled in a single Pillow pass instead of
+        # drawing each module separately. The rows are already bytes, so
+        # translate converts them to pixels without a per-module loop
+        width, height = qr.symbol_size(scale=1, border=0)
+        pixels = b"".join(qr.matrix).translate(MODULE_PIXELS)
+        bitmap = Image.frombytes("L", (width, height), pixels)
+        bitmap = ImageOps.expand(bitmap, border=border, fill=255)
+        modules = bitmap.width
+        
+        # Scale the preview to the largest integer multiple of the module
+        # count that fits the 300px display area
+        preview_size = modules * max(1, 300 // modules)
+        preview = bitmap.resize((preview_size, preview_size), Image.Resampling.NEAREST)
+        
+        # Create QR code image at the selected size for saving
+        image_size = modules * box_size
+        qr_image = bitmap.resize((image_size, image_size), Image.Resampling.NEAREST)
+        
+        return qr, qr_image, preview
     
     def generate_qr_code(self):
         """
@@ -262,59 +345,152 @@ class QRCodeGenerator:
             data = self.url_entry.get().strip()
             
             if not data:
+                from tkinter import messagebox
                 messagebox.showerror("Error", "Please enter a URL or text to generate QR code")
                 return
             
-            # Update status
-            self.status_var.set("Generating QR code...")
-            self.root.update()
-            
             # Get parameters
             box_size, border = self.get_size_params()
             error_correction = self.get_error_correction()
             
-            # Create QR code instance
-            qr = qrcode.QRCode(
-                version=1,  # Controls the size of the QR Code
-                error_correction=error_correction,
-                box_size=box_size,
-                border=border,
-            )
-            
-            # Add data to QR code
-            qr.add_data(data)
-            qr.make(fit=True)
-            
-            # Create QR code image
-            self.qr_image = qr.make_image(fill_color="black", back_color="white")
-            
-            # Resize image for display (maintain aspect ratio)
-            display_size = (300, 300)
-            display_image = self.qr_image.resize(display_size, Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage for tkinter
-            self.photo = ImageTk.PhotoImage(display_image)
-            
-            # Update the label with the QR code image
-            self.qr_label.configure(image=self.photo, text="")
-            self.qr_label.image = self.photo  # Keep a reference
-            
-            # Store current data
-            self.current_data = data
-            
-            # Enable save button
-            self.save_btn.configure(state='normal')
+            # Reuse the images from an earlier generation with the same
+            # input and options instead of encoding and rendering again
+            key = (data, box_size, border, error_correction)
+            cached = self._qr_cache.get(key)
+            if cached is not None:
+                self._qr_cache.move_to_end(key)
+                self._show_qr(key, *cached)
+                return
             
             # Update status
-            self.status_var.set(f"QR code generated successfully for: {data[:50]}...")
+            self.status_var.set("Generating QR code...")
+            self.generate_btn.configure(state='disabled')
             
-            # Log generation
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] QR code generated for: {data}")
+            # Render on the worker thread and poll for the result so the
+            # event loop keeps running in the meantime
+            future = self._pool.submit(self._render_qr, *key)
+            self._pending_render = future
+            self.root.after(30, self._check_render, future, key)
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate QR code: {str(e)}")
-            self.status_var.set("Error generating QR code")
-            print(f"Error: {e}")
+            self._generation_failed(e)
+    
+    def _check_render(self, future, key):
+        """
+        Display the QR code once the worker thread has rendered it.
+        
+        Args:
+            future: Future returned by submitting _render_qr
+            key: Cache key of (data, box_size, border, error_correction)
+        """
+        if not future.done():
+            self.root.after(30, self._check_render, future, key)
+            return
+        
+        # The form was cleared while rendering, so only keep the result
+        # for later reuse without displaying it or reporting errors
+        if future is not self._pending_render:
+            if future.exception() is None:
+                self._cache_qr(key, future.result())
+            return
+        
+        self._pending_render = None
+        self.generate_btn.configure(state='normal')
+        
+        try:
+            result = future.result()
+            self._cache_qr(key, result)
+            self._show_qr(key, *result)
+            
+        except Exception as e:
+            self._generation_failed(e)
+    
+    def _cache_qr(self, key, result):
+        """
+        Store a rendered QR code for reuse, evicting the oldest entry.
+        
+        Args:
+            key: Cache key of (data, box_size, border, error_correction)
+            result: (qr_code, qr_image, preview) tuple from _render_qr
+        """
+        self._qr_cache[key] = result
+        if len(self._qr_cache) > self.QR_CACHE_SIZE:
+            self._qr_cache.popitem(last=False)
+    
+    def _show_qr(self, key, qr_code, qr_image, preview):
+        """
+        Display a generated QR code and make it available for saving.
+        
+        Args:
+            key: Cache key of (data, box_size, border, error_correction)
+            qr_code: The encoded segno.QRCode
+            qr_image: Image rendered at the selected size for saving
+            preview: Image rendered to fit the display area
+        """
+        data, box_size, border, _ = key
+        self.qr_code = qr_code
+        self.qr_size_params = (box_size, border)
+        self.qr_image = qr_image
+        
+        # Convert to PhotoImage for tkinter, reusing the one built the
+        # last time this QR code was shown
+        self.photo = self._photo_cache.get(key)
+        if self.photo is not None:
+            self._photo_cache.move_to_end(key)
+        else:
+            self.photo = ImageTk.PhotoImage(preview)
+            self._photo_cache[key] = self.photo
+            if len(self._photo_cache) > self.PHOTO_CACHE_SIZE:
+                self._photo_cache.popitem(last=False)
+        
+        # Update the label with the QR code image
+        self.qr_label.configure(image=self.photo, text="")
+        self.qr_label.image = self.photo  # Keep a reference
+        
+        # Store current data
+        self.current_data = data
+        
+        # Enable save button
+        self.save_btn.configure(state='normal')
+        
+        # Update status
+        self.status_var.set(f"QR code generated successfully for: {data[:50]}...")
+        
+        # Log generation
+        self._log_event(f"QR code generated for: {data}")
+    
+    def _log_event(self, message):
+        """
+        Record a user action in the in-memory activity log.
+        
+        Args:
+            message: Description of the action
+        """
+        self._log.append((time.monotonic(), message))
+    
+    def _generation_failed(self, error):
+        """
+        Report a failed QR code generation.
+        
+        Args:
+            error: The exception raised while generating
+        """
+        from tkinter import messagebox
+        
+        self.generate_btn.configure(state='normal')
+        
+        # segno is only imported on the first render, so a missing install
+        # surfaces here rather than at startup
+        if isinstance(error, ImportError):
+            messagebox.showerror(
+                "Error",
+                f"Missing required library: {error}\n"
+                "Please install it with: pip install segno"
+            )
+        else:
+            messagebox.showerror("Error", f"Failed to generate QR code: {str(error)}")
+        self.status_var.set("Error generating QR code")
+        self._log_event(f"Error: {error}")
     
     def save_qr_code(self):
         """
@@ -322,6 +498,8 @@ class QRCodeGenerator:
         
         Opens a file dialog for the user to choose where to save the image.
         """
+        from tkinter import filedialog, messagebox
+        
         if not self.qr_image:
             messagebox.showwarning("Warning", "No QR code to save. Please generate one first.")
             return
@@ -333,14 +511,27 @@ class QRCodeGenerator:
                 filetypes=[
                     ("PNG files", "*.png"),
                     ("JPEG files", "*.jpg"),
+                    ("SVG files", "*.svg"),
                     ("All files", "*.*")
                 ],
                 title="Save QR Code As"
             )
             
             if filename:
-                # Save the image
-                self.qr_image.save(filename)
+                # Save the image, writing SVG straight from the QR matrix
+                # as a vector image rather than encoding the raster. PNGs are
+                # saved as 1-bit with fast compression since QR bitmaps
+                # compress well anyway
+                extension = os.path.splitext(filename)[1].lower()
+                if extension == ".svg":
+                    box_size, border = self.qr_size_params
+                    self.qr_code.save(filename, kind="svg", scale=box_size, border=border)
+                elif extension == ".png":
+                    self.qr_image.convert("1").save(filename, format="PNG", optimize=False, compress_level=1)
+                elif extension in (".jpg", ".jpeg"):
+                    self.qr_image.save(filename, format="JPEG", quality=90, optimize=False)
+                else:
+                    self.qr_image.save(filename)
                 
                 # Update status
                 self.status_var.set(f"QR code saved to: {os.path.basename(filename)}")
@@ -349,7 +540,7 @@ class QRCodeGenerator:
                 messagebox.showinfo("Success", f"QR code saved successfully to:\n{filename}")
                 
                 # Log save action
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] QR code saved to: {filename}")
+                self._log_event(f"QR code saved to: {filename}")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save QR code: {str(e)}")
@@ -359,12 +550,17 @@ class QRCodeGenerator:
         """
         Clear the form and reset the interface.
         """
+        # Discard any render still in progress
+        self._pending_render = None
+        self.generate_btn.configure(state='normal')
+        
         # Clear input
         self.url_entry.delete(0, tk.END)
         self.url_entry.insert(0, "https://example.com")
         
         # Reset QR code display
         self.qr_label.configure(image="", text="QR Code will appear here")
+        self.qr_code = None
         self.qr_image = None
         
         # Reset variables
@@ -377,7 +573,14 @@ class QRCodeGenerator:
         # Update status
         self.status_var.set("Form cleared - Ready to generate QR codes")
         
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Form cleared")
+        self._log_event("Form cleared")
+    
+    def on_close(self):
+        """
+        Stop the render worker and close the window.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 
 def main():
@@ -410,7 +613,7 @@ def main():
     except ImportError as e:
         print(f"Missing required library: {e}")
         print("Please install required packages:")
-        print("pip install qrcode[pil] pillow")
+        print("pip install pillow")
     except Exception as e:
         print(f"Application error: {e}")
 